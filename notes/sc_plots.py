@@ -1,16 +1,16 @@
 import numpy as np
 
 from src.superconductor_losses import perp_loss, parallel_loss, norris_equation
-from bokeh.plotting import figure, output_file, show
-
-flux_dens = np.linspace(0.01, .1, 200)
 
 """
 This file creates plots from the superconductor losses.
+
+bokeh is imported inside the plotting functions, so importing this module
+stays cheap for callers that only reuse the loss formulas.
 """
 
 
-def plot_pp_losses():
+def plot_pp_losses(show_plot=True):
     """Plots the parallel and the perpendicular losses, the parameters are based on:
     N. Magnussona,*, A. Wolfbrandt. AC losses in high-temperature superconducting tapes exposed
     to longitudinal magnetic fields
@@ -21,12 +21,16 @@ def plot_pp_losses():
     The losses due to perpendicular magnetic fields follow (2) with Bc=11 mT and K=1.35.
     Both the parallel and the longitudinal field losses follow (3), with B equal to B∥ or B=.
     """
+    from bokeh.plotting import figure, output_file, show
+
+    flux_dens = np.linspace(0.01, .1, 200)
+
     p = figure(title="Losses", y_axis_type="log", x_range=(0.01, 1), y_range=(0.01, 30))
     # background_fill_color="#fafafa")
 
     p.line(
         flux_dens,
-        perp_loss(1.35, 50, 4.29 * 1e-3, 0.015, flux_dens),
+        perp_loss(50, flux_dens, K=1.35, w=4.29 * 1e-3, bc=0.015),
         legend_label="perpendicular loss",
         line_color="tomato",
         line_dash="dashed",
@@ -34,14 +38,13 @@ def plot_pp_losses():
     )
 
     f = 50.0
-    c = (0.75,)
+    c = 0.75
     bp = 0.0344
     Ac = 0.21 * 4.29 * 1e-6
 
-    bpv = np.vectorize(parallel_loss)
     p.line(
         flux_dens,
-        bpv(f, c, Ac, flux_dens, bp),
+        parallel_loss(flux_dens, f, C=c, ac=Ac, bp=bp),
         legend_label="parallel losses",
         line_dash="dotted",
         line_color="indigo",
@@ -50,17 +53,21 @@ def plot_pp_losses():
 
     p.legend.location = "top_left"
 
-    output_file("logplot.html", title="log plot example")
+    if show_plot:
+        output_file("logplot.html", title="log plot example")
+        show(p)
 
-    show(p)
+    return p
 
 
-def plot_self_field_losses():
+def plot_self_field_losses(show_plot=True):
     """Plots the parallel and the perpendicular losses, the parameters are based on:
     N. Magnussona,*, A. Wolfbrandt. AC losses in high-temperature superconducting tapes exposed
     to longitudinal magnetic fields
     """
 
+    from bokeh.plotting import figure, output_file, show
+
     Ic = 115.0  # A
     current = np.linspace(2.0, 114.9, 100)
 
@@ -78,8 +85,11 @@ def plot_self_field_losses():
     p.legend.location = "top_left"
 
     # p.output_backend = "svg"
-    output_file("logplot2.html", title="log plot example")
-    show(p)
+    if show_plot:
+        output_file("logplot2.html", title="log plot example")
+        show(p)
+
+    return p
 
 
 if __name__ == "__main__":
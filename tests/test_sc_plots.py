@@ -0,0 +1,13 @@
+from unittest import TestCase
+
+from notes.sc_plots import plot_pp_losses, plot_self_field_losses
+
+
+class TestScPlots(TestCase):
+
+    def test_plot_pp_losses(self):
+        # smoke test, building the figure should not raise or write any output file
+        self.assertIsNotNone(plot_pp_losses(show_plot=False))
+
+    def test_plot_self_field_losses(self):
+        self.assertIsNotNone(plot_self_field_losses(show_plot=False))
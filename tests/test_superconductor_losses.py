@@ -1,6 +1,6 @@
 from unittest import TestCase
 from src.superconductor_losses import parallel_loss, perp_loss, norris_equation, cryostat_losses, cryo_surface, \
-    thermal_incomes, cooler_cost, sc_load_loss, magnusson_ac_loss
+    thermal_incomes, cooler_cost, sc_load_loss, magnusson_ac_loss, make_parallel_loss, make_perp_loss
 
 from math import pi
 
@@ -74,6 +74,37 @@ class TestLosses(TestCase):
         # perpendicular losses
         self.assertAlmostEqual(perp_loss(50, 20. * 1e-3), 0.1625, 1)
 
+    def test_magnusson_ac_loss_broadcast(self):
+        # sweeping the frequency as an array should match the scalar evaluations
+        import numpy as np
+
+        res = magnusson_ac_loss(0.03, 0.02, np.array([50.0, 60.0]), 25)
+
+        self.assertAlmostEqual(float(res[0]), magnusson_ac_loss(0.03, 0.02, 50.0, 25), 6)
+        self.assertAlmostEqual(float(res[1]), magnusson_ac_loss(0.03, 0.02, 60.0, 25), 6)
+
+    def test_array_parameters(self):
+        # a scalar field combined with an array parameter must take the broadcasting
+        # array path instead of the scalar kernels (which only accept scalars)
+        import numpy as np
+
+        res = perp_loss(50, 20. * 1e-3, bc=np.array([0.015, 0.02]))
+        self.assertAlmostEqual(float(res[0]), perp_loss(50, 20. * 1e-3, bc=0.015), 6)
+        self.assertAlmostEqual(float(res[1]), perp_loss(50, 20. * 1e-3, bc=0.02), 6)
+
+        res = parallel_loss(50. * 1e-3, 50, bp=np.array([34.4 * 1e-3, 60. * 1e-3]))
+        self.assertAlmostEqual(float(res[0]), parallel_loss(50. * 1e-3, 50, bp=34.4 * 1e-3), 6)
+        self.assertAlmostEqual(float(res[1]), parallel_loss(50. * 1e-3, 50, bp=60. * 1e-3), 6)
+
+    def test_loss_factories(self):
+        # the factory-made functions should give back the same values as the originals
+        ploss = make_parallel_loss(50)
+        qloss = make_perp_loss(50)
+
+        self.assertAlmostEqual(float(ploss(66. * 1e-3)), parallel_loss(66. * 1e-3, 50), 6)
+        self.assertAlmostEqual(float(ploss(20. * 1e-3)), parallel_loss(20. * 1e-3, 50), 6)
+        self.assertAlmostEqual(float(qloss(68. * 1e-3)), perp_loss(50, 68. * 1e-3), 6)
+
     def test_cryostat_losses(self):
         r_in = 0.5 / pi
         r_ou = 1.0 / pi